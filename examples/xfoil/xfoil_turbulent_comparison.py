@@ -57,8 +57,9 @@ def compare_xfoil_turbulent() -> None:
     s = np.linspace(s_ref[0], s_ref[-1], 101)
 
     # Setup Head methods
-    delta_m0 = xfoil_visc.delta_m_upper()[0]
-    shape_d0 = xfoil_visc.shape_d_upper()[0]
+    station0 = xfoil_visc.upper(0)
+    delta_m0 = station0.delta_m
+    shape_d0 = station0.shape_d
     hm_visc = HeadMethod(nu=nu_inf, U_e=[s_ref, u_e_visc])
     hm_visc.initial_delta_m = delta_m0
     hm_visc.initial_shape_d = shape_d0
@@ -89,36 +90,56 @@ def compare_xfoil_turbulent() -> None:
     shape_d_ref = np.array(xfoil_visc.shape_d_upper())
     c_f_ref = np.array(xfoil_visc.c_f_upper())
 
-    s_ref_visc = s_ref[s_ref < s_sep_visc]
-    delta_d_ref_visc = delta_d_ref[s_ref < s_sep_visc]
-    delta_m_ref_visc = delta_m_ref[s_ref < s_sep_visc]
-    shape_d_ref_visc = shape_d_ref[s_ref < s_sep_visc]
-    c_f_ref_visc = c_f_ref[s_ref < s_sep_visc]
+    attached_visc = s_ref < s_sep_visc
+    s_ref_visc = s_ref[attached_visc]
+    delta_d_ref_visc = delta_d_ref[attached_visc]
+    delta_m_ref_visc = delta_m_ref[attached_visc]
+    shape_d_ref_visc = shape_d_ref[attached_visc]
+    c_f_ref_visc = c_f_ref[attached_visc]
 
-    s_ref_inv = s_ref[s_ref < s_sep_inv]
-    delta_d_ref_inv = delta_d_ref[s_ref < s_sep_inv]
-    delta_m_ref_inv = delta_m_ref[s_ref < s_sep_inv]
-    shape_d_ref_inv = shape_d_ref[s_ref < s_sep_inv]
-    c_f_ref_inv = c_f_ref[s_ref < s_sep_inv]
+    attached_inv = s_ref < s_sep_inv
+    s_ref_inv = s_ref[attached_inv]
+    delta_d_ref_inv = delta_d_ref[attached_inv]
+    delta_m_ref_inv = delta_m_ref[attached_inv]
+    shape_d_ref_inv = shape_d_ref[attached_inv]
+    c_f_ref_inv = c_f_ref[attached_inv]
 
     s_visc = np.linspace(s_ref[0], min(s_ref[-1], s_sep_visc), 101)
-    delta_d_visc = hm_visc.delta_d(s_visc)
     delta_m_visc = hm_visc.delta_m(s_visc)
     shape_d_visc = hm_visc.shape_d(s_visc)
+    delta_d_visc = delta_m_visc*shape_d_visc
     c_f_visc = 2*hm_visc.tau_w(s_visc, rho_inf)/(rho_inf*u_inf**2)
     v_e_visc = hm_visc.v_e(s_visc)
     du_e_visc = hm_visc.du_e(s_visc)
     d2u_e_visc = hm_visc.d2u_e(s_visc)
 
     s_inv = np.linspace(s_ref[0], min(s_ref[-1], s_sep_inv), 101)
-    delta_d_inv = hm_inv.delta_d(s_inv)
     delta_m_inv = hm_inv.delta_m(s_inv)
     shape_d_inv = hm_inv.shape_d(s_inv)
+    delta_d_inv = delta_m_inv*shape_d_inv
     c_f_inv = 2*hm_inv.tau_w(s_inv, rho_inf)/(rho_inf*u_inf**2)
     v_e_inv = hm_inv.v_e(s_inv)
     du_e_inv = hm_inv.du_e(s_inv)
     d2u_e_inv = hm_inv.d2u_e(s_inv)
 
+    # Calculate the relative differences at the reference stations
+    delta_m_cmp_visc = hm_visc.delta_m(s_ref_visc)
+    shape_d_cmp_visc = hm_visc.shape_d(s_ref_visc)
+    delta_d_cmp_visc = delta_m_cmp_visc*shape_d_cmp_visc
+    c_f_cmp_visc = 2*hm_visc.tau_w(s_ref_visc, rho_inf)/(rho_inf*u_inf**2)
+
+    delta_m_cmp_inv = hm_inv.delta_m(s_ref_inv)
+    shape_d_cmp_inv = hm_inv.shape_d(s_ref_inv)
+    delta_d_cmp_inv = delta_m_cmp_inv*shape_d_cmp_inv
+    c_f_cmp_inv = 2*hm_inv.tau_w(s_ref_inv, rho_inf)/(rho_inf*u_inf**2)
+
+    # Normalize the arc-length coordinates by the chord once for plotting
+    s_ref_on_c = s_ref/c
+    s_visc_on_c = s_visc/c
+    s_inv_on_c = s_inv/c
+    s_ref_visc_on_c = s_ref_visc/c
+    s_ref_inv_on_c = s_ref_inv/c
+
     # Plot results
     # pylint: disable=duplicate-code
     fig = plt.figure()
@@ -148,12 +169,12 @@ def compare_xfoil_turbulent() -> None:
 
     # Displacement thickness in 0,:
     ax = axis_delta_d
-    ref_curve = ax.plot(s_ref/c, delta_d_ref/c, color=ref_color,
+    ref_curve = ax.plot(s_ref_on_c, delta_d_ref/c, color=ref_color,
                         label=ref_label)
-    thwaites_visc_curve = ax.plot(s_visc/c, delta_d_visc/c,
+    thwaites_visc_curve = ax.plot(s_visc_on_c, delta_d_visc/c,
                                   color=thwaites_visc_color,
                                   label=thwaites_visc_label)
-    thwaites_inv_curve = ax.plot(s_inv/c, delta_d_inv/c,
+    thwaites_inv_curve = ax.plot(s_inv_on_c, delta_d_inv/c,
                                  color=thwaites_inv_color,
                                  label=thwaites_inv_label)
     _ = ax.set_ylim(0, 0.007)
@@ -161,11 +182,11 @@ def compare_xfoil_turbulent() -> None:
     ax.grid(True)
 
     ax = axis_delta_d_diff
-    _ = ax.plot(s_ref_visc/c,
-                np.abs(1-hm_visc.delta_d(s_ref_visc)/delta_d_ref_visc),
+    _ = ax.plot(s_ref_visc_on_c,
+                np.abs(1-delta_d_cmp_visc/delta_d_ref_visc),
                 color=thwaites_visc_color)
-    _ = ax.plot(s_ref_inv/c,
-                np.abs(1-hm_inv.delta_d(s_ref_inv)/delta_d_ref_inv),
+    _ = ax.plot(s_ref_inv_on_c,
+                np.abs(1-delta_d_cmp_inv/delta_d_ref_inv),
                 color=thwaites_inv_color)
     _ = ax.set_ylabel("Relative Difference")
     _ = ax.set_ylim((1e-3,1))
@@ -174,19 +195,19 @@ def compare_xfoil_turbulent() -> None:
 
     # Momentum thickness in 1,:
     ax = axis_delta_m
-    _ = ax.plot(s_ref/c, delta_m_ref/c, color=ref_color)
-    _ = ax.plot(s_visc/c, delta_m_visc/c, color=thwaites_visc_color)
-    _ = ax.plot(s_inv/c, delta_m_inv/c, color=thwaites_inv_color)
+    _ = ax.plot(s_ref_on_c, delta_m_ref/c, color=ref_color)
+    _ = ax.plot(s_visc_on_c, delta_m_visc/c, color=thwaites_visc_color)
+    _ = ax.plot(s_inv_on_c, delta_m_inv/c, color=thwaites_inv_color)
     _ = ax.set_ylim(0, 0.0043)
     _ = ax.set_ylabel(r"$\delta_m/c$")
     ax.grid(True)
 
     ax = axis_delta_m_diff
-    _ = ax.plot(s_ref_visc/c,
-                np.abs(1-hm_visc.delta_m(s_ref_visc)/delta_m_ref_visc),
+    _ = ax.plot(s_ref_visc_on_c,
+                np.abs(1-delta_m_cmp_visc/delta_m_ref_visc),
                 color=thwaites_visc_color)
-    _ = ax.plot(s_ref_inv/c,
-                np.abs(1-hm_inv.delta_m(s_ref_inv)/delta_m_ref_inv),
+    _ = ax.plot(s_ref_inv_on_c,
+                np.abs(1-delta_m_cmp_inv/delta_m_ref_inv),
                 color=thwaites_inv_color)
     _ = ax.set_ylabel("Relative Difference")
     _ = ax.set_ylim((1e-4,1))
@@ -195,19 +216,17 @@ def compare_xfoil_turbulent() -> None:
 
     # Displacement shape factor in 2,:
     ax = axis_shape_d
-    _ = ax.plot(s_ref/c, shape_d_ref, color=ref_color)
-    _ = ax.plot(s_visc/c, shape_d_visc, color=thwaites_visc_color)
-    _ = ax.plot(s_inv/c, shape_d_inv, color=thwaites_inv_color)
+    _ = ax.plot(s_ref_on_c, shape_d_ref, color=ref_color)
+    _ = ax.plot(s_visc_on_c, shape_d_visc, color=thwaites_visc_color)
+    _ = ax.plot(s_inv_on_c, shape_d_inv, color=thwaites_inv_color)
     _ = ax.set_ylim(1.4, 2.4)
     _ = ax.set_ylabel(r"$H_d$")
     ax.grid(True)
 
     ax = axis_shape_d_diff
-    _ = ax.plot(s_ref_visc/c, np.abs(1-hm_visc.shape_d(s_ref_visc)
-                                     /shape_d_ref_visc),
+    _ = ax.plot(s_ref_visc_on_c, np.abs(1-shape_d_cmp_visc/shape_d_ref_visc),
                 color=thwaites_visc_color)
-    _ = ax.plot(s_ref_inv/c, np.abs(1-hm_inv.shape_d(s_ref_inv)
-                                    /shape_d_ref_inv),
+    _ = ax.plot(s_ref_inv_on_c, np.abs(1-shape_d_cmp_inv/shape_d_ref_inv),
                 color=thwaites_inv_color)
     _ = ax.set_ylabel("Relative Difference")
     _ = ax.set_ylim((1e-3,1))
@@ -216,23 +235,19 @@ def compare_xfoil_turbulent() -> None:
 
     # Skin friction coefficient in 3,:
     ax = axis_c_f
-    _ = ax.plot(s_ref/c, c_f_ref, color=ref_color)
-    _ = ax.plot(s_visc/c, c_f_visc, color=thwaites_visc_color)
-    _ = ax.plot(s_inv/c, c_f_inv, color=thwaites_inv_color)
+    _ = ax.plot(s_ref_on_c, c_f_ref, color=ref_color)
+    _ = ax.plot(s_visc_on_c, c_f_visc, color=thwaites_visc_color)
+    _ = ax.plot(s_inv_on_c, c_f_inv, color=thwaites_inv_color)
     _ = ax.set_ylim(0, 0.01)
     _ = ax.set_ylabel(r"$c_f$")
     ax.grid(True)
 
     ax = axis_c_f_diff
-    _ = ax.plot(s_ref_visc/c,
-                np.abs(1-2*hm_visc.tau_w(s_ref_visc,
-                                         rho_inf)/(rho_inf
-                                                   *u_inf**2)/c_f_ref_visc),
+    _ = ax.plot(s_ref_visc_on_c,
+                np.abs(1-c_f_cmp_visc/c_f_ref_visc),
                 color=thwaites_visc_color)
-    _ = ax.plot(s_ref_inv/c,
-                np.abs(1-2*hm_inv.tau_w(s_ref_inv,
-                                        rho_inf)/(rho_inf
-                                                  *u_inf**2)/c_f_ref_inv),
+    _ = ax.plot(s_ref_inv_on_c,
+                np.abs(1-c_f_cmp_inv/c_f_ref_inv),
                 color=thwaites_inv_color)
     _ = ax.set_ylabel("Relative Difference")
     _ = ax.set_ylim((1e-3,1))
@@ -241,15 +256,15 @@ def compare_xfoil_turbulent() -> None:
 
     # Edge velocity in 4,:
     ax = axis_u_e
-    _ = ax.plot(s_ref/c, u_e_visc/u_inf, color=thwaites_visc_color)
-    _ = ax.plot(s_ref/c, u_e_inv/u_inf, color=thwaites_inv_color)
+    _ = ax.plot(s_ref_on_c, u_e_visc/u_inf, color=thwaites_visc_color)
+    _ = ax.plot(s_ref_on_c, u_e_inv/u_inf, color=thwaites_inv_color)
     _ = ax.set_ylim((0, 1.25))
     _ = ax.set_ylabel(r"$U_e/U_\infty$")
     ax.grid(True)
 
     ax = axis_du_e
-    _ = ax.plot(s_visc/c, du_e_visc, color=thwaites_visc_color)
-    _ = ax.plot(s_inv/c, du_e_inv, color=thwaites_inv_color)
+    _ = ax.plot(s_visc_on_c, du_e_visc, color=thwaites_visc_color)
+    _ = ax.plot(s_inv_on_c, du_e_inv, color=thwaites_inv_color)
     _ = ax.set_ylim((-10, 0))
     _ = ax.set_xlabel(r"$x/c$")
     _ = ax.set_ylabel(r"d$U_e/$d$x$ (1/s)")
@@ -257,16 +272,16 @@ def compare_xfoil_turbulent() -> None:
 
     # Transpiration velocity in 5,:
     ax = axis_d2u_e
-    _ = ax.plot(s_visc/c, d2u_e_visc, color=thwaites_visc_color)
-    _ = ax.plot(s_inv/c, d2u_e_inv, color=thwaites_inv_color)
+    _ = ax.plot(s_visc_on_c, d2u_e_visc, color=thwaites_visc_color)
+    _ = ax.plot(s_inv_on_c, d2u_e_inv, color=thwaites_inv_color)
     _ = ax.set_ylim((-20, 5))
     _ = ax.set_xlabel(r"$x/c$")
     _ = ax.set_ylabel(r"d$^2U_e/$d$x^2$ (1/(m$\cdot$s)")
     ax.grid(True)
 
     ax = axis_v_e
-    _ = ax.plot(s_visc/c, v_e_visc/u_inf, color=thwaites_visc_color)
-    _ = ax.plot(s_inv/c, v_e_inv/u_inf, color=thwaites_inv_color)
+    _ = ax.plot(s_visc_on_c, v_e_visc/u_inf, color=thwaites_visc_color)
+    _ = ax.plot(s_inv_on_c, v_e_inv/u_inf, color=thwaites_inv_color)
     _ = ax.set_ylim((0, 0.01))
     _ = ax.set_xlabel(r"$x/c$")
     _ = ax.set_ylabel(r"$V_e/U_e$")
@@ -7,17 +7,22 @@ the boundary layer equations.
 
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import numpy.typing as npt
 from scipy.integrate import solve_ivp
-from scipy.integrate import quad
 from scipy.optimize import root_scalar
 
 from ibl.typing import InputParam, SolutionFunc
 
 
+# converged solver parameters keyed on the similarity coefficients so that
+# repeated solutions of the same equation skip the secant searches
+_solved_parameters: Dict[Tuple[float, float, float],
+                         Tuple[float, float]] = {}
+
+
 class Analytic2dSimilarityIncompressible(ABC):
     """
     Base implementation to the 2d similarity solutions.
@@ -469,13 +474,21 @@ class Analytic2dSimilarityIncompressible(ABC):
         self._eta_m = (self.fw_pp
                        - self._beta*self.eta_d)/(self._alpha+self._beta)
 
-        def k_fun(eta: float) -> float:
-            return float(2*self.f(eta)*self.f_p(eta)*self.f_pp(eta))
+        # bind the solution function locally so the root finder callback
+        # skips the attribute lookups on every evaluation
+        f_p = self.f_p
 
-        self._eta_k = quad(k_fun, 0, self.eta_inf)[0]
+        # integrate the kinetic energy term with a fixed Gauss-Legendre
+        # rule; the integrand is smooth so one batched dense-output
+        # evaluation covers all the nodes
+        if self._f is None:
+            raise ValueError("ODE solution not set.")
+        nodes, weights = np.polynomial.legendre.leggauss(64)
+        f, f_p_v, f_pp = self._f(0.5*self.eta_inf*(nodes + 1.0))
+        self._eta_k = self.eta_inf*(weights @ (f*f_p_v*f_pp))
 
         def s_fun(eta: float) -> float:
-            return float(0.99-self.f_p(eta))
+            return float(0.99-f_p(eta))
 
         sol = root_scalar(s_fun, method="bisect", bracket=[0, self.eta_inf])
         if not sol.converged:
@@ -509,6 +522,12 @@ class Analytic2dSimilarityIncompressible(ABC):
         beta = self._beta
         gamma = self._gamma
 
+        # reuse previously converged parameters when nothing is pinned
+        key = (round(alpha, 12), round(beta, 12), round(gamma, 12))
+        free_search = (eta_inf is None) and (fw_pp is None)
+        if free_search and (key in _solved_parameters):
+            eta_inf, fw_pp = _solved_parameters[key]
+
         if (eta_inf is None) or (fw_pp is None):
             # setup eta_inf solution process
             if eta_inf is None:
@@ -568,7 +587,7 @@ class Analytic2dSimilarityIncompressible(ABC):
                         ODE derivatives.
                     """
                     _ = eta  # To avoid pylint unused-argument message
-                    f_p = np.zeros_like(f)
+                    f_p = np.empty_like(f)
 
                     f_p[0] = eta_inf*f[1]
                     f_p[1] = eta_inf*f[2]
@@ -627,6 +646,8 @@ class Analytic2dSimilarityIncompressible(ABC):
                     eta_inf_prev = eta_inf_curr
                     eta_inf_curr = eta_inf_prev + delta_eta_inf
                 j = j + 1
+            if free_search:
+                _solved_parameters[key] = (eta_inf_curr, fw_pp_curr)
         else:
             eta_inf_curr = eta_inf
             fw_pp_curr = fw_pp
@@ -649,7 +670,7 @@ class Analytic2dSimilarityIncompressible(ABC):
                 ODE derivatives.
             """
             _ = eta  # To avoid pylint unused-argument message
-            f_p = np.zeros_like(f)
+            f_p = np.empty_like(f)
 
             f_p[0] = f[1]
             f_p[1] = f[2]
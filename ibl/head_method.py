@@ -19,6 +19,10 @@ from ibl.initial_condition import ManualCondition
 from ibl.typing import InputParam
 
 
+# entrainment shape factor at the correlation break point, H_d = 1.6
+_SHAPE_ENTRAINMENT_BREAK = 3.3 + 0.8234/(1.6 - 1.1)**1.287
+
+
 class HeadMethod(IBLMethod):
     """
     Models a turbulent bondary layer using Head's Method (1958).
@@ -99,11 +103,12 @@ class HeadMethod(IBLMethod):
         if self._solution is None:
             raise ValueError("No valid solution.")
 
-        y_p = self._ode_impl(x, self._solution(x))
-        shape_d = self.shape_d(x)
+        f = self._solution(x)
+        delta_m = f[0]
+        shape_d = f[1]
+        y_p = self._ode_impl(x, f)
         u_e = self.u_e(x)
         du_e = self.du_e(x)
-        delta_m = self.delta_m(x)
         return du_e*shape_d*delta_m + u_e*y_p[1]*delta_m + u_e*shape_d*y_p[0]
 
     @override
@@ -217,8 +222,9 @@ class HeadMethod(IBLMethod):
         if self._solution is None:
             raise ValueError("No valid solution.")
 
-        delta_m = self._solution(x)[0]
-        shape_d = self._solution(x)[1]
+        f = self._solution(x)
+        delta_m = f[0]
+        shape_d = f[1]
         u_e = self.u_e(x)
         u_e[np.abs(u_e) < 0.001] = 0.001
         re_delta_m = u_e*delta_m/self._nu
@@ -277,21 +283,19 @@ class HeadMethod(IBLMethod):
         numpy.ndarray
             The right-hand side of the ODE at the given state.
         """
-        f_p = np.zeros_like(f)
         delta_m = f[0]
-        shape_d = np.asarray(f[1])
-        if (shape_d < 1.11).any():
-            shape_d[shape_d < 1.11] = 1.11
+        shape_d = np.maximum(f[1], 1.11)
         u_e = self.u_e(x)
         if isinstance(u_e, float):
             u_e = max(u_e, 0.001)
         else:
-            u_e[np.abs(u_e) < 0.001] = 0.001
+            u_e = np.where(np.abs(u_e) < 0.001, 0.001, u_e)
         du_e = self.du_e(x)
         re_delta_m = u_e*delta_m/self._nu
         c_f = c_f_fun(re_delta_m, shape_d)
         shape_entrainment = self._shape_entrainment(shape_d)
         shape_entrainment_p = self._shape_entrainment_p(shape_d)
+        f_p = np.empty_like(f)
         f_p[0] = 0.5*c_f-delta_m*(2+shape_d)*du_e/u_e
         f_p[1] = (u_e*self._entrainment_velocity(shape_entrainment)
                   - u_e*f_p[0]*shape_entrainment
@@ -320,22 +324,11 @@ class HeadMethod(IBLMethod):
 #            raise ValueError("Cannot pass displacement shape factor less "
 #                             "than 1.1: {}".format(np.amin(H_d)))
 
-        def shape_entrainment_low(shape_d: InputParam) -> InputParam:
-            a = 0.8234
-            b = 1.1
-            c = 1.287
-            d = 3.3
-            return d + a/(shape_d - b)**c
-
-        def shape_entrainment_high(shape_d: InputParam) -> InputParam:
-            a = 1.5501
-            b = 0.6778
-            c = 3.064
-            d = 3.32254659218600974
-            return d + a/(shape_d - b)**c
-
-        return np.piecewise(shape_d, [shape_d <= 1.6, shape_d > 1.6],
-                            [shape_entrainment_low, shape_entrainment_high])
+        # both branches are finite above 1.1 so evaluate branchlessly
+        return np.where(shape_d <= 1.6,
+                        3.3 + 0.8234/(shape_d - 1.1)**1.287,
+                        3.32254659218600974
+                        + 1.5501/(shape_d - 0.6778)**3.064)
 
     @staticmethod
     def _shape_entrainment_p(shape_d: InputParam) -> npt.NDArray:
@@ -358,20 +351,10 @@ class HeadMethod(IBLMethod):
 #            raise ValueError("Cannot pass displacement shape factor less "
 #                             "than 1.1: {}".format(np.amin(H_d)))
 
-        def shape_entrainment_low(shape_d: InputParam) -> InputParam:
-            a = 0.8234
-            b = 1.1
-            c = 1.287
-            return -a*c/(shape_d - b)**(c+1)
-
-        def shape_entrainment_high(shape_d: InputParam) -> InputParam:
-            a = 1.5501
-            b = 0.6778
-            c = 3.064
-            return -a*c/(shape_d - b)**(c+1)
-
-        return np.piecewise(shape_d, [shape_d <= 1.6, shape_d > 1.6],
-                            [shape_entrainment_low, shape_entrainment_high])
+        # both branches are finite above 1.1 so evaluate branchlessly
+        return np.where(shape_d <= 1.6,
+                        -0.8234*1.287/(shape_d - 1.1)**2.287,
+                        -1.5501*3.064/(shape_d - 0.6778)**4.064)
 
     @staticmethod
     def _shape_d(shape_entrainment: InputParam) -> npt.NDArray:
@@ -408,7 +391,7 @@ class HeadMethod(IBLMethod):
             d = 3.3
             return b + (a/(shape_entrainment - d))**(1/c)
 
-        shape_entrainment_break = HeadMethod._shape_entrainment(1.6)
+        shape_entrainment_break = _SHAPE_ENTRAINMENT_BREAK
         return np.piecewise(shape_entrainment,
                             [shape_entrainment <= shape_entrainment_break,
                              shape_entrainment > shape_entrainment_break],
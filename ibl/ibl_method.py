@@ -335,14 +335,14 @@ class IBLMethod(ABC):
         self._ic: InitialCondition = FalknerSkanStagCondition(0, nu)
 
         # set the velocity terms
+        self._u_e: Optional[Callable] = None
+        self._du_e: Optional[Callable] = None
+        self._d2u_e: Optional[Callable] = None
         if u_e is None:
             if du_e is not None:
                 raise ValueError("Must specify u_e if specifying du_e")
             if d2u_e is not None:
                 raise ValueError("Must specify u_e if specifying d2u_e")
-            self._u_e: Optional[Callable] = None
-            self._du_e: Optional[Callable] = None
-            self._d2u_e: Optional[Callable] = None
         else:
             self.set_velocity(u_e, du_e, d2u_e)
 
@@ -406,16 +406,26 @@ class IBLMethod(ABC):
         """
         def fd_1f(fun: Callable, xo: InputParam, dx: float) -> InputParam:
             """Use finite differences to approximate the derivative."""
-            return ((fun(xo-2*dx) - fun(xo+2*dx))/12
-                    - 2*(fun(xo-dx) - fun(xo+dx))/3)/dx
+            # evaluate the entire stencil with one batched call
+            samples = fun(np.add.outer(dx*np.array([-2.0, -1.0, 1.0, 2.0]),
+                                       xo))
+            weights = np.array([1, -8, 8, -1])/(12*dx)
+            return weights @ samples
         def fd_2f(fun: Callable, xo: InputParam, dx: float) -> InputParam:
-            """Use finite differences to approximate the derivative."""
-            return (-(fun(xo-2*dx) + fun(xo+2*dx))/12
-                    -2.5*(fun(xo))
-                    +4*(fun(xo-dx) + fun(xo+dx))/3)/(dx**2)
+            """Use finite differences to approximate the second derivative."""
+            # evaluate the entire stencil with one batched call
+            samples = fun(np.add.outer(dx*np.array([-2.0, -1.0, 0.0,
+                                                    1.0, 2.0]), xo))
+            weights = np.array([-1, 16, -30, 16, -1])/(12*dx**2)
+            return weights @ samples
 
         # check if U_e is callable
         if callable(u_e):
+            # reuse existing derivative objects if same velocity function is
+            #   set again (e.g. repeated solves in a parameter sweep)
+            if ((u_e is self._u_e) and (du_e is None) and (d2u_e is None)
+                    and (self._du_e is not None)):
+                return
             self._u_e = u_e
 
             # if dU_edx not provided then use finite differences
@@ -428,7 +438,7 @@ class IBLMethod(ABC):
                 if (hasattr(u_e, "derivative")
                         and callable(getattr(u_e, "derivative"))):
                     self._du_e = u_e.derivative()
-                    self._d2u_e = u_e.derivative(2)
+                    self._d2u_e = self._du_e.derivative()
                 else:
                     # FIX: This is depricated in scipy
                     def du_e_fun(x:InputParam) -> InputParam:
@@ -505,8 +515,11 @@ class IBLMethod(ABC):
                     raise ValueError("Must pass at least two points for edge "
                                      + "velocity")
 
+                # build the spline and its derivative splines once
                 u_e_spline = PchipInterpolator(x_pts, u_e_pts)
-                self.set_velocity(u_e_spline)
+                self._u_e = u_e_spline
+                self._du_e = u_e_spline.derivative()
+                self._d2u_e = u_e_spline.derivative(2)
             else:
                 # otherwise unknown velocity input
                 raise ValueError(f"Don't know how to use {u_e} to initialize "
@@ -556,7 +569,7 @@ class IBLMethod(ABC):
             atol = atol_set
 
         # setup the ODE solver
-        kill_events = self._kill_events
+        kill_events = list(self._kill_events)
 
         if isinstance(term_event, list):
             kill_events += term_event
@@ -5,7 +5,7 @@ This module provides the capability of reading in XFoil dump files.
 """
 
 import copy
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -51,6 +51,7 @@ class XFoilReader:
         self._upper: List[XFoilAirfoilData] = []
         self._lower: List[XFoilAirfoilData] = []
         self._wake: List[XFoilWakeData] = []
+        self._cache: Dict[Tuple[str, str], npt.NDArray] = {}
         self.filename = filename
 
     @property
@@ -175,23 +176,28 @@ class XFoilReader:
         self._upper = []
         self._lower = []
         self._wake = []
+        self._cache = {}
         if filename == "":
             return
 
         # get rows from file
         airfoil_data, wake_data = self._get_dump_data(filename)
 
+        # parse each row of airfoil data once
+        airfoil_pts = [XFoilAirfoilData(x) for x in airfoil_data]
+
+        # find the first station on the lower surface
+        on_lower = np.array([pt.u_e_rel for pt in airfoil_pts]) < 0
+        idx_lower = int(np.argmax(on_lower)) if on_lower.any() else -1
+
         # extract the upper airfoil data
-        idx_lower = -1
-        for idx, ad in enumerate(airfoil_data):
-            new_pt = XFoilAirfoilData(ad)
-            if new_pt.u_e_rel < 0:
-                idx_lower = idx
-                break
-            self._upper.insert(0, new_pt)
+        if idx_lower < 0:
+            self._upper = airfoil_pts[::-1]
+        elif idx_lower > 0:
+            self._upper = airfoil_pts[idx_lower-1::-1]
 
         # extract the lower aifoil data
-        self._lower = [XFoilAirfoilData(x) for x in airfoil_data[idx_lower:]]
+        self._lower = airfoil_pts[idx_lower:]
         for a in self._lower:
             a.u_e_rel *= -1
             a.mass_defect *= -1
@@ -307,6 +313,32 @@ class XFoilReader:
         """
         return self._wake[i]
 
+    def _gather(self, surface: str, quantity: str) -> npt.NDArray:
+        """
+        Return the array of a station quantity over a surface.
+
+        The array is built on first access and cached until a new dump file
+        is read.
+
+        Parameters
+        ----------
+        surface : str
+            Name of surface: "upper", "lower", or "wake".
+        quantity : str
+            Name of the station attribute to collect.
+
+        Returns
+        -------
+        numpy.ndarray
+            Quantity value at each station on the surface.
+        """
+        key = (surface, quantity)
+        if key not in self._cache:
+            stations = getattr(self, "_" + surface)
+            self._cache[key] = np.array([getattr(sd, quantity)
+                                         for sd in stations])
+        return self._cache[key]
+
     def s_upper(self) -> npt.NDArray:
         """
         Return arc-length distances from stagnation point for upper surface.
@@ -317,10 +349,7 @@ class XFoilReader:
             Arc-length distances from the stagnation point for the upper
             surface.
         """
-        s = []
-        for sd in self._upper:
-            s.append(sd.s)
-        return np.array(s)
+        return self._gather("upper", "s")
 
     def s_lower(self) -> npt.NDArray:
         """
@@ -332,10 +361,7 @@ class XFoilReader:
             Arc-length distances from the stagnation point for the lower
             surface.
         """
-        s = []
-        for sd in self._lower:
-            s.append(sd.s)
-        return np.array(s)
+        return self._gather("lower", "s")
 
     def s_wake(self) -> npt.NDArray:
         """
@@ -346,10 +372,7 @@ class XFoilReader:
         numpy.ndarray
             Arc-length distances from the airfoil trailing edge.
         """
-        s = []
-        for sd in self._wake:
-            s.append(sd.s)
-        return np.array(s)
+        return self._gather("wake", "s")
 
     def x_upper(self) -> npt.NDArray:
         """
@@ -360,10 +383,7 @@ class XFoilReader:
         numpy.ndarray
             Chord locations for upper surface of airfoil.
         """
-        x = []
-        for sd in self._upper:
-            x.append(sd.x)
-        return np.array(x)
+        return self._gather("upper", "x")
 
     def x_lower(self) -> npt.NDArray:
         """
@@ -374,10 +394,7 @@ class XFoilReader:
         numpy.ndarray
             Chord locations for lower surface of airfoil.
         """
-        x = []
-        for sd in self._lower:
-            x.append(sd.x)
-        return np.array(x)
+        return self._gather("lower", "x")
 
     def x_wake(self) -> npt.NDArray:
         """
@@ -388,10 +405,7 @@ class XFoilReader:
         numpy.ndarray
             Chord locations for airfoil wake.
         """
-        x = []
-        for sd in self._wake:
-            x.append(sd.x)
-        return np.array(x)
+        return self._gather("wake", "x")
 
     def y_upper(self) -> npt.NDArray:
         """
@@ -402,10 +416,7 @@ class XFoilReader:
         numpy.ndarray
             Normal locations for upper surface of airfoil.
         """
-        y = []
-        for sd in self._upper:
-            y.append(sd.y)
-        return np.array(y)
+        return self._gather("upper", "y")
 
     def y_lower(self) -> npt.NDArray:
         """
@@ -416,10 +427,7 @@ class XFoilReader:
         numpy.ndarray
             Normal locations for lower surface of airfoil.
         """
-        y = []
-        for sd in self._lower:
-            y.append(sd.y)
-        return np.array(y)
+        return self._gather("lower", "y")
 
     def y_wake(self) -> npt.NDArray:
         """
@@ -430,10 +438,7 @@ class XFoilReader:
         numpy.ndarray
             Normal locations for airfoil wake.
         """
-        y = []
-        for sd in self._wake:
-            y.append(sd.y)
-        return np.array(y)
+        return self._gather("wake", "y")
 
     def u_e_upper(self) -> npt.NDArray:
         """
@@ -444,10 +449,7 @@ class XFoilReader:
         numpy.ndarray
             Nondimensionalized velocities for upper surface of airfoil.
         """
-        u_e_rel = []
-        for sd in self._upper:
-            u_e_rel.append(sd.u_e_rel)
-        return self.u_ref*np.array(u_e_rel)
+        return self.u_ref*self._gather("upper", "u_e_rel")
 
     def u_e_lower(self) -> npt.NDArray:
         """
@@ -458,10 +460,7 @@ class XFoilReader:
         numpy.ndarray
             Nondimensionalized velocities for lower surface of airfoil.
         """
-        u_e_rel = []
-        for sd in self._lower:
-            u_e_rel.append(sd.u_e_rel)
-        return self.u_ref*np.array(u_e_rel)
+        return self.u_ref*self._gather("lower", "u_e_rel")
 
     def u_e_wake(self) -> npt.NDArray:
         """
@@ -472,10 +471,7 @@ class XFoilReader:
         numpy.ndarray
             Nondimensionalized velocities for airfoil wake.
         """
-        u_e_rel = []
-        for sd in self._wake:
-            u_e_rel.append(sd.u_e_rel)
-        return self.u_ref*np.array(u_e_rel)
+        return self.u_ref*self._gather("wake", "u_e_rel")
 
     def delta_d_upper(self) -> npt.NDArray:
         """
@@ -486,10 +482,7 @@ class XFoilReader:
         numpy.ndarray
             Displacement thicknesses for upper surface of airfoil.
         """
-        delta_d = []
-        for sd in self._upper:
-            delta_d.append(sd.delta_d)
-        return np.array(delta_d)
+        return self._gather("upper", "delta_d")
 
     def delta_d_lower(self) -> npt.NDArray:
         """
@@ -500,10 +493,7 @@ class XFoilReader:
         numpy.ndarray
             Displacement thicknesses for lower surface of airfoil.
         """
-        delta_d = []
-        for sd in self._lower:
-            delta_d.append(sd.delta_d)
-        return np.array(delta_d)
+        return self._gather("lower", "delta_d")
 
     def delta_d_wake(self) -> npt.NDArray:
         """
@@ -514,10 +504,7 @@ class XFoilReader:
         numpy.ndarray
             Displacement thicknesses for airfoil wake.
         """
-        delta_d = []
-        for sd in self._wake:
-            delta_d.append(sd.delta_d)
-        return np.array(delta_d)
+        return self._gather("wake", "delta_d")
 
     def delta_m_upper(self) -> npt.NDArray:
         """
@@ -528,10 +515,7 @@ class XFoilReader:
         numpy.ndarray
             Momentum thicknesses for upper surface of airfoil.
         """
-        delta_m = []
-        for sd in self._upper:
-            delta_m.append(sd.delta_m)
-        return np.array(delta_m)
+        return self._gather("upper", "delta_m")
 
     def delta_m_lower(self) -> npt.NDArray:
         """
@@ -542,10 +526,7 @@ class XFoilReader:
         numpy.ndarray
             Momentum thicknesses for lower surface of airfoil.
         """
-        delta_m = []
-        for sd in self._lower:
-            delta_m.append(sd.delta_m)
-        return np.array(delta_m)
+        return self._gather("lower", "delta_m")
 
     def delta_m_wake(self) -> npt.NDArray:
         """
@@ -556,10 +537,7 @@ class XFoilReader:
         numpy.ndarray
             Momentum thicknesses for airfoil wake.
         """
-        delta_m = []
-        for sd in self._wake:
-            delta_m.append(sd.delta_m)
-        return np.array(delta_m)
+        return self._gather("wake", "delta_m")
 
     def delta_k_upper(self) -> npt.NDArray:
         """
@@ -570,10 +548,8 @@ class XFoilReader:
         numpy.ndarray
             Kinetic energy thicknesses for upper surface of airfoil.
         """
-        delta_k = []
-        for sd in self._upper:
-            delta_k.append(sd.shape_k*sd.delta_m)
-        return np.array(delta_k)
+        return (self._gather("upper", "shape_k")
+                *self._gather("upper", "delta_m"))
 
     def delta_k_lower(self) -> npt.NDArray:
         """
@@ -584,10 +560,8 @@ class XFoilReader:
         numpy.ndarray
             Kinetic energy thicknesses for lower surface of airfoil.
         """
-        delta_k = []
-        for sd in self._lower:
-            delta_k.append(sd.shape_k*sd.delta_m)
-        return np.array(delta_k)
+        return (self._gather("lower", "shape_k")
+                *self._gather("lower", "delta_m"))
 
     def shape_d_upper(self) -> npt.NDArray:
         """
@@ -598,10 +572,7 @@ class XFoilReader:
         numpy.ndarray
             Displacement shape factor for upper surface of airfoil.
         """
-        shape_d = []
-        for sd in self._upper:
-            shape_d.append(sd.shape_d)
-        return np.array(shape_d)
+        return self._gather("upper", "shape_d")
 
     def shape_d_lower(self) -> npt.NDArray:
         """
@@ -612,10 +583,7 @@ class XFoilReader:
         numpy.ndarray
             Displacement shape factor for lower surface of airfoil.
         """
-        shape_d = []
-        for sd in self._lower:
-            shape_d.append(sd.shape_d)
-        return np.array(shape_d)
+        return self._gather("lower", "shape_d")
 
     def shape_d_wake(self) -> npt.NDArray:
         """
@@ -626,10 +594,7 @@ class XFoilReader:
         numpy.ndarray
             Displacement shape factor for airfoil wake.
         """
-        shape_d = []
-        for sd in self._wake:
-            shape_d.append(sd.shape_d)
-        return np.array(shape_d)
+        return self._gather("wake", "shape_d")
 
     def shape_k_upper(self) -> npt.NDArray:
         """
@@ -640,10 +605,7 @@ class XFoilReader:
         numpy.ndarray
             Kinetic energy shape factor for upper surface of airfoil.
         """
-        shape_k = []
-        for sd in self._upper:
-            shape_k.append(sd.shape_k)
-        return np.array(shape_k)
+        return self._gather("upper", "shape_k")
 
     def shape_k_lower(self) -> npt.NDArray:
         """
@@ -654,10 +616,7 @@ class XFoilReader:
         numpy.ndarray
             Kinetic energy shape factor for lower surface of airfoil.
         """
-        shape_k = []
-        for sd in self._lower:
-            shape_k.append(sd.shape_k)
-        return np.array(shape_k)
+        return self._gather("lower", "shape_k")
 
     def c_f_upper(self) -> npt.NDArray:
         """
@@ -668,10 +627,7 @@ class XFoilReader:
         numpy.ndarray
             Skin friction coefficient for upper surface of airfoil.
         """
-        c_f = []
-        for sd in self._upper:
-            c_f.append(sd.c_f)
-        return np.array(c_f)
+        return self._gather("upper", "c_f")
 
     def c_f_lower(self) -> npt.NDArray:
         """
@@ -682,10 +638,7 @@ class XFoilReader:
         numpy.ndarray
             Skin friction coefficient for lower surface of airfoil.
         """
-        c_f = []
-        for sd in self._lower:
-            c_f.append(sd.c_f)
-        return np.array(c_f)
+        return self._gather("lower", "c_f")
 
     def mass_defect_upper(self) -> npt.NDArray:
         """
@@ -696,10 +649,7 @@ class XFoilReader:
         numpy.ndarray
             Mass defect for upper surface of airfoil.
         """
-        mass_defect = []
-        for sd in self._upper:
-            mass_defect.append(sd.mass_defect)
-        return np.array(mass_defect)
+        return self._gather("upper", "mass_defect")
 
     def mass_defect_lower(self) -> npt.NDArray:
         """
@@ -710,10 +660,7 @@ class XFoilReader:
         numpy.ndarray
             Mass defect for lower surface of airfoil.
         """
-        mass_defect = []
-        for sd in self._lower:
-            mass_defect.append(sd.mass_defect)
-        return np.array(mass_defect)
+        return self._gather("lower", "mass_defect")
 
     def mom_defect_upper(self) -> npt.NDArray:
         """
@@ -724,10 +671,7 @@ class XFoilReader:
         numpy.ndarray
             Momentum defect for upper surface of airfoil.
         """
-        mom_defect = []
-        for sd in self._upper:
-            mom_defect.append(sd.mom_defect)
-        return np.array(mom_defect)
+        return self._gather("upper", "mom_defect")
 
     def mom_defect_lower(self) -> npt.NDArray:
         """
@@ -738,10 +682,7 @@ class XFoilReader:
         numpy.ndarray
             Momentum defect for lower surface of airfoil.
         """
-        mom_defect = []
-        for sd in self._lower:
-            mom_defect.append(sd.mom_defect)
-        return np.array(mom_defect)
+        return self._gather("lower", "mom_defect")
 
     def ke_defect_upper(self) -> npt.NDArray:
         """
@@ -752,10 +693,7 @@ class XFoilReader:
         numpy.ndarray
             Kinetic energy defect for upper surface of airfoil.
         """
-        ke_defect = []
-        for sd in self._upper:
-            ke_defect.append(sd.ke_defect)
-        return np.array(ke_defect)
+        return self._gather("upper", "ke_defect")
 
     def ke_defect_lower(self) -> npt.NDArray:
         """
@@ -766,10 +704,7 @@ class XFoilReader:
         numpy.ndarray
             Kinetic energy defect for lower surface of airfoil.
         """
-        ke_defect = []
-        for sd in self._lower:
-            ke_defect.append(sd.ke_defect)
-        return np.array(ke_defect)
+        return self._gather("lower", "ke_defect")
 
     def _get_dump_data(self, filename: str) -> Tuple[List[str], List[str]]:
         """
@@ -182,11 +182,14 @@ class ThwaitesMethod(IBLMethod):
         u_e = self.u_e(x)
         du_e = self.du_e(x)
         delta_m2_on_nu = self._solution(x)[0]
-        term1 = du_e*self.delta_d(x)
+        lam = self._calc_lambda(x, delta_m2_on_nu)
+        shape_d = self._model.shape(lam)
+        delta_m = np.sqrt(delta_m2_on_nu*self._nu)
+        term1 = du_e*delta_m*shape_d
         term2 = np.sqrt(self._nu/delta_m2_on_nu)
         dsol_dx = self._ode_impl(x, delta_m2_on_nu)
-        term3 = 0.5*u_e*self.shape_d(x)*dsol_dx
-        term4a = self._model.shape_p(self._calc_lambda(x, delta_m2_on_nu))
+        term3 = 0.5*u_e*shape_d*dsol_dx
+        term4a = self._model.shape_p(lam)
         term4 = u_e*delta_m2_on_nu*term4a
         term5 = du_e*dsol_dx+self.d2u_e(x)*delta_m2_on_nu
         return term1 + term2*(term3+term4*term5)
@@ -665,11 +668,24 @@ class _ThwaitesFunctionsSpline(_ThwaitesFunctions):
                                  +0.0160, +0.0320, +0.0480, +0.0640, +0.0800,
                                  +0.1000, +0.1200, +0.1400, +0.2000, +0.2500])
 
+    # Spline fits shared by all instances since the data is fixed
+    _shear_fit: Optional[CubicSpline] = None
+    _shape_fit: Optional[CubicSpline] = None
+    _shape_p_fit: Optional[Callable] = None
+
     def __init__(self) -> None:
         # Spline fits to Thwaites original data Edland
-        shear = CubicSpline(self._tab_lambda, self._tab_shear)
-        shape = CubicSpline(self._tab_lambda, self._tab_shape)
-        shape_p = shape.derivative()
+        cls = _ThwaitesFunctionsSpline
+        shear = cls._shear_fit
+        shape = cls._shape_fit
+        shape_p = cls._shape_p_fit
+        if shear is None or shape is None or shape_p is None:
+            shear = CubicSpline(self._tab_lambda, self._tab_shear)
+            shape = CubicSpline(self._tab_lambda, self._tab_shape)
+            shape_p = shape.derivative()
+            cls._shear_fit = shear
+            cls._shape_fit = shape
+            cls._shape_p_fit = shape_p
 
         super().__init__("Thwaites Splines", shear, shape, shape_p,
                          np.min(self._tab_lambda), np.max(self._tab_lambda))
@@ -174,7 +174,7 @@ class TestBlasius(unittest.TestCase):
         # def ke_fun(eta: FunType) -> FunType:
         #     f_p = sol.f_p(eta)
         #     return f_p*(1-f_p**2)
-        # self.eta_k_ref = quadrature(ke_fun, 0, 10)[0]
+        # self.eta_k_ref = quad_vec(ke_fun, 0, 10)[0]
         # print(f"eta_k = {eta_k_ref:.10f}")
 
         # displacement thickness
@@ -2,78 +2,90 @@
 
 import platform
 
-from typing import Union
+from pathlib import Path
+from typing import List
 
 import unittest
 import numpy as np
 import numpy.typing as npt
 import numpy.testing as np_test
-from scipy.integrate import quad
 
 from ibl.analytic import FalknerSkan
+from ibl.typing import InputParam
+
+
+# Tabulated data from White (2011) stored with np.savez.
+# Note that there are errors in the data:
+#    * beta = -0.1988 beta = -0.19883785
+#    * beta = -0.18 @ eta = 5.0
+#    * CASE 2
+_REF = np.load(Path(__file__).parent/"data"/"falkner_skan_ref.npz",
+               mmap_mode="r")
+_ETA_REF = _REF["eta_ref"]
+_F_P_REF = _REF["f_p_ref"]
+# Note: beta_ref[0] is different than White because of rounding
+_BETA_REF = _REF["beta_ref"]
+_FW_PP_REF = _REF["fw_pp_ref"]
+_ETA_D_REF = _REF["eta_d_ref"]
+_ETA_M_REF = _REF["eta_m_ref"]
+_ETA_K_REF = _REF["eta_k_ref"]  # from calculation
+_ETA_S_REF = _REF["eta_s_ref"]
+# Note: _ETA_INF_REF[0] is significantly different on MacOS and Windows
+if platform.system() == 'Darwin':
+    _ETA_INF_REF = np.array([9.9113972, 7.9263214, 7.1451323, 6.7517934,
+                             6.0672747, 5.6670098])
+elif platform.system() == 'Windows':
+    _ETA_INF_REF = np.array([8.1305755, 7.9263214, 7.1451323, 6.7517934,
+                             6.0672747, 5.6670098])
+else:
+    _ETA_INF_REF = np.array([8.2571417, 7.9263214, 7.1451323, 6.7517934,
+                             6.0672747, 5.6670098])
+
+# guard the shared reference tables against accidental mutation
+for _table in (_ETA_REF, _F_P_REF, _ETA_INF_REF, _BETA_REF, _FW_PP_REF,
+               _ETA_D_REF, _ETA_M_REF, _ETA_K_REF, _ETA_S_REF):
+    _table.setflags(write=False)
+del _table
+
+
+def _fast_close(actual: InputParam, desired: InputParam, rtol: float = 0.0,
+                atol: float = 0.0) -> None:
+    """Check closeness cheaply, deferring to assert_allclose on failure."""
+    if not np.all(np.abs(np.asarray(actual)-desired)
+                  <= atol + rtol*np.abs(desired)):
+        np_test.assert_allclose(actual, desired, rtol=rtol, atol=atol)
 
 
 class TestFalknerSkan(unittest.TestCase):
     """Class to test the Falkner-Skan class."""
 
-    # Tabluated data from White (2011)
-    # Note that there are errors in the data:
-    #    * beta = -0.1988 beta = -0.19883785
-    #    * beta = -0.18 @ eta = 5.0
-    #    * CASE 2
-    eta_ref = np.array([0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0,
-                        1.2, 1.4, 1.6, 1.8, 2.0, 2.2, 2.4, 2.6, 2.8, 3.0, 3.2,
-                        3.4, 3.6, 3.8, 4.0, 4.5, 5.0])
-    f_p_ref = np.array([[0.00000, 0.00099, 0.00398, 0.00895, 0.01591, 0.02485,
-                         0.03578, 0.04868, 0.06355, 0.08038, 0.09913, 0.14232,
-                         0.19274, 0.24982, 0.31271, 0.38026, 0.45097, 0.52308,
-                         0.59460, 0.66348, 0.72776, 0.78578, 0.83635, 0.87882,
-                         0.91315, 0.93982, 0.97940, 0.99439],
-                        [0.00000, 0.01376, 0.02933, 0.04668, 0.06582, 0.08673,
-                         0.10937, 0.13373, 0.15975, 0.18737, 0.21651, 0.27899,
-                         0.34622, 0.41691, 0.48946, 0.56205, 0.63269, 0.69942,
-                         0.76048, 0.81449, 0.86061, 0.89853, 0.92854, 0.95138,
-                         0.96805, 0.97975, 0.99449, 0.99881],
-                        [0.00000, 0.04696, 0.09391, 0.14081, 0.18761, 0.23423,
-                         0.28058, 0.32653, 0.37196, 0.41672, 0.46063, 0.54525,
-                         0.62439, 0.69670, 0.76106, 0.81669, 0.86330, 0.90107,
-                         0.93060, 0.95288, 0.96905, 0.98037, 0.98797, 0.99289,
-                         0.99594, 0.99777, 0.99957, 0.99994],
-                        [0.00000, 0.07597, 0.14894, 0.21886, 0.28569, 0.34938,
-                         0.40988, 0.46713, 0.52107, 0.57167, 0.61890, 0.70322,
-                         0.77425, 0.83254, 0.87906, 0.91509, 0.94211, 0.96173,
-                         0.97548, 0.98480, 0.99088, 0.99471, 0.99704, 0.99840,
-                         0.99916, 0.99958, 0.99994, 0.99999],
-                        [0.00000, 0.11826, 0.22661, 0.32524, 0.41446, 0.49465,
-                         0.56628, 0.62986, 0.68594, 0.73508, 0.77787, 0.84667,
-                         0.89681, 0.93235, 0.95683, 0.97322, 0.98385, 0.99055,
-                         0.99463, 0.99705, 0.99842, 0.99919, 0.99959, 0.99980,
-                         0.99991, 0.99996, 0.99999, 1.00000],
-                        [0.00000, 0.15876, 0.29794, 0.41854, 0.52190, 0.60964,
-                         0.68343, 0.74496, 0.79587, 0.83767, 0.87172, 0.92142,
-                         0.95308, 0.97269, 0.98452, 0.99146, 0.99542, 0.99761,
-                         0.99879, 0.99940, 0.99972, 0.99987, 0.99995, 0.99998,
-                         0.99999, 1.00000, 1.00000, 1.00000]])
-    # Note: eta_inf_ref[0] is significantly different on MacOS and Windows
-    if platform.system() == 'Darwin':
-        eta_inf_ref = np.array([9.9113972, 7.9263214, 7.1451323, 6.7517934,
-                                6.0672747, 5.6670098])
-    elif platform.system() == 'Windows':
-        eta_inf_ref = np.array([8.1305755, 7.9263214, 7.1451323, 6.7517934,
-                                6.0672747, 5.6670098])
-    else:
-        eta_inf_ref = np.array([8.2571417, 7.9263214, 7.1451323, 6.7517934,
-                                6.0672747, 5.6670098])
-    # Note: beta_ref[0] is different than White because of rounding
-    beta_ref = np.array([-0.19883785, -0.18, 0, 0.3, 1.0, 2.0])
-    fw_pp_ref = np.array([0, 0.12864, 0.46960, 0.77476, 1.23259, 1.68722])
-    eta_d_ref = np.array([2.35885, 1.87157, 1.21678, 0.91099, 0.64790,
-                          0.49743])
-    eta_m_ref = np.array([0.58544, 0.56771, 0.46960, 0.38574, 0.29235,
-                          0.23079])
-    eta_k_ref = np.array([0.88698, 0.86649, 0.73848, 0.61780, 0.47528,
-                          0.37790])  # from calculation
-    eta_s_ref = np.array([4.79, 4.28, 3.47, 2.965, 2.379, 1.949])
+    # Tabluated data from White (2011), bound from the module-level tables
+    eta_ref = _ETA_REF
+    f_p_ref = _F_P_REF
+    eta_inf_ref = _ETA_INF_REF
+    beta_ref = _BETA_REF
+    fw_pp_ref = _FW_PP_REF
+    eta_d_ref = _ETA_D_REF
+    eta_m_ref = _ETA_M_REF
+    eta_k_ref = _ETA_K_REF
+    eta_s_ref = _ETA_S_REF
+
+    # fixed quadrature rule for reference integrals over [0, 10]
+    _gl_nodes: npt.NDArray
+    _gl_weights: npt.NDArray
+
+    # solutions for each tabulated beta, solved once and shared by the
+    # read-only tests
+    _sols: List[FalknerSkan]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the quadrature rule and solutions shared by the tests."""
+        nodes, weights = np.polynomial.legendre.leggauss(64)
+        cls._gl_nodes = 5.0*(nodes + 1.0)
+        cls._gl_weights = 5.0*weights
+        cls._sols = [FalknerSkan(beta=beta, u_ref=10.0, nu_ref=1e-5)
+                     for beta in cls.beta_ref]
 
     def test_setters(self) -> None:
         """Test the setters."""
@@ -118,100 +130,78 @@ class TestFalknerSkan(unittest.TestCase):
         with self.assertRaises(ValueError):
             sol.reset_beta(beta=-1.0)
 
-    def test_beta_solutions(self) -> None:
-        """Test the cases from White table."""
+    def test_beta_similarity_tables(self) -> None:
+        """Test the similarity terms from White table."""
+        # Test the solved boundary conditions
+        np_test.assert_allclose([sol.fw_pp for sol in self._sols],
+                                self.fw_pp_ref, atol=1e-3)
+
+        # Test the solutions for f'
+        np_test.assert_allclose(
+            np.stack([sol.f_p(self.eta_ref) for sol in self._sols]),
+            self.f_p_ref, atol=2e-3)
+
+        # Test the boundary layer values
+        #
+        # def ke_fun(eta: FunType) -> FunType:
+        #     f_p = sol.f_p(eta)
+        #     return f_p*(1-f_p**2)
+        # eta_k_ref = quad_vec(ke_fun, 0, 10)[0]
+        # print(f"eta_k = {eta_k_ref:.10f}")
+
+        # similarity terms
+        np_test.assert_allclose([sol.eta_d for sol in self._sols],
+                                self.eta_d_ref, rtol=5e-3)
+        np_test.assert_allclose([sol.eta_m for sol in self._sols],
+                                self.eta_m_ref, rtol=3e-5)
+        np_test.assert_allclose([sol.eta_s for sol in self._sols],
+                                self.eta_s_ref, atol=0.007)
+        np_test.assert_allclose([sol.eta_k for sol in self._sols],
+                                self.eta_k_ref, rtol=8e-6)
+
+    def test_beta_eta_inf(self) -> None:
+        """Test the maximum similarity coordinates from White cases."""
+        for idx in range(0, 6):
+            with self.subTest(i=idx):
+                self.assertAlmostEqual(self._sols[idx].eta_inf,
+                                       self.eta_inf_ref[idx], delta=5e-7)
+
+    def test_beta_dimensional_terms(self) -> None:
+        """Test the dimensional terms from White cases."""
         u_inf = 10
         nu = 1e-5
         rho = 1
 
-        FunType = Union[float, np.floating, npt.NDArray]
-
-        for idx in range(0, 6):
+        for idx in range(0, 5):
             with self.subTest(i=idx):
-                sol = FalknerSkan(beta=self.beta_ref[idx], u_ref=u_inf,
-                                  nu_ref=nu)
-
-                # Test the solved boundary condition
-                self.assertIsNone(np_test.assert_allclose(sol.fw_pp,
-                                                          self.fw_pp_ref[idx],
-                                                          atol=1e-3))
-
-                # Test the solution for f'
-                self.assertIsNone(
-                    np_test.assert_allclose(sol.f_p(self.eta_ref),
-                                            self.f_p_ref[idx,:],
-                                            atol=2e-3))
-
-                # test the eta_inf
-                self.assertAlmostEqual(sol.eta_inf, self.eta_inf_ref[idx],
-                                       delta=5e-7)
-
-                # Test the boundary layer values
-                #
-                # def ke_fun(eta: FunType) -> FunType:
-                #     f_p = sol.f_p(eta)
-                #     return f_p*(1-f_p**2)
-                # eta_k_ref = quadrature(ke_fun, 0, 10)[0]
-                # print(f"eta_k = {eta_k_ref:.10f}")
-
-                # similarity terms
-                self.assertIsNone(np_test.assert_allclose(sol.eta_d,
-                                                          self.eta_d_ref[idx],
-                                                          rtol=5e-3))
-                self.assertIsNone(np_test.assert_allclose(sol.eta_m,
-                                                          self.eta_m_ref[idx],
-                                                          rtol=3e-5))
-                self.assertIsNone(np_test.assert_allclose(sol.eta_s,
-                                                          self.eta_s_ref[idx],
-                                                          atol=0.007))
-                self.assertIsNone(np_test.assert_allclose(sol.eta_k,
-                                                          self.eta_k_ref[idx],
-                                                          rtol=8e-6))
-
-                # dimensional terms
-                if idx < 5:
-                    x = np.linspace(0.2, 2, 101)
-                    u_e = u_inf*x**sol.m
-                    g = np.sqrt(0.5*(sol.m+1)*u_e/(nu*x))
-                    delta_d_ref = self.eta_d_ref[idx]/g
-                    self.assertIsNone(np_test.assert_allclose(sol.delta_d(x),
-                                                              delta_d_ref,
-                                                              rtol=3e-3))
-                    delta_m_ref = self.eta_m_ref[idx]/g
-                    self.assertIsNone(np_test.assert_allclose(sol.delta_m(x),
-                                                              delta_m_ref,
-                                                              rtol=3e-5))
-                    delta_k_ref = self.eta_k_ref[idx]/g
-                    self.assertIsNone(np_test.assert_allclose(sol.delta_k(x),
-                                                              delta_k_ref,
-                                                              rtol=8e-6))
-                    delta_s_ref = self.eta_s_ref[idx]/g
-                    self.assertIsNone(np_test.assert_allclose(sol.delta_s(x),
-                                                              delta_s_ref,
-                                                              rtol=2e-3))
-                    shape_d_ref = delta_d_ref/delta_m_ref
-                    shape_k_ref = delta_k_ref/delta_m_ref
-                    self.assertIsNone(np_test.assert_allclose(sol.shape_d(x),
-                                                              shape_d_ref,
-                                                              rtol=2e-3))
-                    self.assertIsNone(np_test.assert_allclose(sol.shape_k(x),
-                                                              shape_k_ref,
-                                                              rtol=2e-5))
-
-                    # test wall shear stress
-                    tau_w_ref = rho*nu*u_e*g*self.fw_pp_ref[idx]
-                    self.assertIsNone(
-                        np_test.assert_allclose(sol.tau_w(x, rho), tau_w_ref,
-                                                atol=2e-4))
-
-                    # test dissipation
-                    def diss_fun(eta: FunType) -> FunType:
-                        # pylint: disable-next=cell-var-from-loop
-                        return sol.f_pp(eta)**2
-                    diss_ref = rho*nu*u_e**2*g*quad(diss_fun, 0, 10)[0]
-                    diss = sol.dissipation(x, rho)
-                    self.assertIsNone(np_test.assert_allclose(diss, diss_ref,
-                                                              atol=2e-5))
+                sol = self._sols[idx]
+
+                x = np.linspace(0.2, 2, 101)
+                u_e = u_inf*x**sol.m
+                g = np.sqrt(0.5*(sol.m+1)*u_inf/nu)*x**(0.5*(sol.m-1))
+                inv_g = 1.0/g
+                delta_d_ref = self.eta_d_ref[idx]*inv_g
+                _fast_close(sol.delta_d(x), delta_d_ref, rtol=3e-3)
+                delta_m_ref = self.eta_m_ref[idx]*inv_g
+                _fast_close(sol.delta_m(x), delta_m_ref, rtol=3e-5)
+                delta_k_ref = self.eta_k_ref[idx]*inv_g
+                _fast_close(sol.delta_k(x), delta_k_ref, rtol=8e-6)
+                delta_s_ref = self.eta_s_ref[idx]*inv_g
+                _fast_close(sol.delta_s(x), delta_s_ref, rtol=2e-3)
+                shape_d_ref = self.eta_d_ref[idx]/self.eta_m_ref[idx]
+                shape_k_ref = self.eta_k_ref[idx]/self.eta_m_ref[idx]
+                _fast_close(np.stack([sol.shape_d(x), sol.shape_k(x)]),
+                            np.array([[shape_d_ref], [shape_k_ref]]),
+                            rtol=2e-3)
+
+                # test wall shear stress
+                tau_w_ref = rho*nu*u_e*g*self.fw_pp_ref[idx]
+                _fast_close(sol.tau_w(x, rho), tau_w_ref, atol=2e-4)
+
+                # test dissipation
+                diss_int = self._gl_weights @ sol.f_pp(self._gl_nodes)**2
+                diss_ref = rho*nu*u_e**2*g*diss_int
+                _fast_close(sol.dissipation(x, rho), diss_ref, atol=2e-5)
 
     def test_problem_values(self) -> None:
         """Test values against Asaithambi (1997) results."""
@@ -45,8 +45,8 @@ class TestHeadMethod(unittest.TestCase):
         shape_d_high = shape_d_break+eps
         shape_entrainment_low = HeadMethod._shape_entrainment(shape_d_low)
         shape_entrainment_high = HeadMethod._shape_entrainment(shape_d_high)
-        self.assertIsNone(np_test.assert_allclose(shape_entrainment_low,
-                                                  shape_entrainment_high))
+        np_test.assert_allclose(shape_entrainment_low,
+                                shape_entrainment_high)
 
         # test that H_d is continuous of H1~3.6374
         shape_entrainment_break = HeadMethod._shape_entrainment(shape_d_break)
@@ -54,38 +54,31 @@ class TestHeadMethod(unittest.TestCase):
         shape_entrainment_high = shape_entrainment_break+eps
         shape_d_low = float(HeadMethod._shape_d(shape_entrainment_low))
         shape_d_high = float(HeadMethod._shape_d(shape_entrainment_high))
-        self.assertIsNone(np_test.assert_allclose(shape_d_low, shape_d_high))
+        np_test.assert_allclose(shape_d_low, shape_d_high)
 
         # test H1 for a range of H_d
-        def shape_entrainment_fun(shape_d: float) -> float:
-            if shape_d <= 1.6:
-                return 3.3 + 0.8234/(shape_d - 1.1)**1.287
-            return 3.32254659218600974 + 1.5501/(shape_d - 0.6778)**3.064
         shape_d = np.linspace(1.11, 2.4, 101)
-        it = np.nditer([shape_d,
-                        None  # type: ignore [arg-type]
-                        ])
-        with it:
-            for sd, se in it:
-                se[...] = shape_entrainment_fun(float(sd))
-            shape_entrainment_ref = it.operands[1]
+        shape_entrainment_ref = np.where(
+            shape_d <= 1.6,
+            3.3 + 0.8234/(shape_d - 1.1)**1.287,
+            3.32254659218600974 + 1.5501/(shape_d - 0.6778)**3.064)
         shape_entrainment = HeadMethod._shape_entrainment(shape_d)
-        self.assertIsNone(np_test.assert_allclose(shape_entrainment,
-                                                  shape_entrainment_ref))
+        np_test.assert_allclose(shape_entrainment,
+                                shape_entrainment_ref)
 
         # test H_d can be recoverd from H1 function
         shape_d_ref = shape_d
         shape_d = HeadMethod._shape_d(shape_entrainment)
-        self.assertIsNone(np_test.assert_allclose(shape_d, shape_d_ref))
+        np_test.assert_allclose(shape_d, shape_d_ref)
 
         # test for invalid values
         shape_entrainment = HeadMethod._shape_entrainment(1.1)
         shape_entrainment_ref = HeadMethod._shape_entrainment(1.1001)
-        self.assertIsNone(np_test.assert_allclose(shape_entrainment,
-                                                  shape_entrainment_ref))
+        np_test.assert_allclose(shape_entrainment,
+                                shape_entrainment_ref)
         ref = HeadMethod._shape_d(3.3)
-        self.assertIsNone(np_test.assert_allclose(ref,
-                                                  HeadMethod._shape_d(3.323)))
+        np_test.assert_allclose(ref,
+                                HeadMethod._shape_d(3.323))
 
     def test_entrainment_velocity_calculation(self) -> None:
         """Test the entrainment velocity calculations."""
@@ -96,12 +89,12 @@ class TestHeadMethod(unittest.TestCase):
         shape_entrainment = np.linspace(3.01, 5, 101)
         e_term_ref = fun(shape_entrainment)
         e_term = HeadMethod._entrainment_velocity(shape_entrainment)
-        self.assertIsNone(np_test.assert_allclose(e_term, e_term_ref))
+        np_test.assert_allclose(e_term, e_term_ref)
 
         # test invalid values
         e_term = HeadMethod._entrainment_velocity(3)
         e_term_ref = HeadMethod._entrainment_velocity(3.001)
-        self.assertIsNone(np_test.assert_allclose(e_term, e_term_ref))
+        np_test.assert_allclose(e_term, e_term_ref)
 
     def test_sample_calculations(self) -> None:
         """Test sample calculations."""
@@ -175,20 +168,20 @@ class TestHeadMethod(unittest.TestCase):
         dissipation_ref = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
                            0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
 
-        self.assertIsNone(np_test.assert_allclose(u_e_ref, hm.u_e(x),
-                                                  atol=1e-7))
-        self.assertIsNone(np_test.assert_allclose(v_e_ref, hm.v_e(x),
-                                                  atol=1e-7))
-        self.assertIsNone(np_test.assert_allclose(delta_d_ref, hm.delta_d(x),
-                                                  atol=1e-7))
-        self.assertIsNone(np_test.assert_allclose(delta_m_ref, hm.delta_m(x),
-                                                  atol=1e-7))
-        self.assertIsNone(np_test.assert_allclose(delta_k_ref, hm.delta_k(x)))
-        self.assertIsNone(np_test.assert_allclose(shape_d_ref, hm.shape_d(x)))
-        self.assertIsNone(np_test.assert_allclose(shape_k_ref, hm.shape_k(x)))
-        self.assertIsNone(np_test.assert_allclose(tau_w_ref, hm.tau_w(x, rho)))
-        self.assertIsNone(np_test.assert_allclose(dissipation_ref,
-                                                  hm.dissipation(x, rho)))
+        np_test.assert_allclose(u_e_ref, hm.u_e(x),
+                                atol=1e-7)
+        np_test.assert_allclose(v_e_ref, hm.v_e(x),
+                                atol=1e-7)
+        np_test.assert_allclose(delta_d_ref, hm.delta_d(x),
+                                atol=1e-7)
+        np_test.assert_allclose(delta_m_ref, hm.delta_m(x),
+                                atol=1e-7)
+        np_test.assert_allclose(delta_k_ref, hm.delta_k(x))
+        np_test.assert_allclose(shape_d_ref, hm.shape_d(x))
+        np_test.assert_allclose(shape_k_ref, hm.shape_k(x))
+        np_test.assert_allclose(tau_w_ref, hm.tau_w(x, rho))
+        np_test.assert_allclose(dissipation_ref,
+                                hm.dissipation(x, rho))
 
 
 if __name__ == "__main__":